@@ -340,7 +340,8 @@ async function main() {
           source: SOURCE,
           chapter: batch[j].chapter,
           content: batch[j].content,
-          embedding: JSON.stringify(embeddings[j]),
+          // Packed float32 BLOB — see KnowledgeChunk in schema.prisma
+          embedding: Buffer.from(new Float32Array(embeddings[j]).buffer),
           tokenCount: Math.ceil(batch[j].content.length / 4),
         },
       });
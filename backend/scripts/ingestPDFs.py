@@ -6,26 +6,50 @@ Usage:
     python3 scripts/ingestPDFs.py --source NASM        # one source
     python3 scripts/ingestPDFs.py --dry-run            # preview chunks, no writes
     python3 scripts/ingestPDFs.py --source ACE --dry-run
+    python3 scripts/ingestPDFs.py --batch-api          # embed via OpenAI Batch API
+    python3 scripts/ingestPDFs.py --resume-batch <id>  # collect an interrupted batch run
 
 Parses certification PDFs with PyMuPDF, chunks text, embeds with
-OpenAI text-embedding-3-small, stores in SQLite KnowledgeChunk table.
-Idempotent: existing chunks for a source are deleted before re-inserting.
+OpenAI text-embedding-3-small, stores in SQLite KnowledgeChunk table
+(embeddings as packed little-endian float32 BLOBs).
+Idempotent: existing chunks for a source are deleted before re-inserting;
+chunks whose content and embedding model are unchanged (same sha256) reuse
+their stored embedding instead of being re-embedded.
 """
 
 import os
 import sys
-import re
+import asyncio
 import json
 import time
+import random
+import struct
+import itertools
+import hashlib
+import multiprocessing
 import sqlite3
 import argparse
 import textwrap
+import threading
+import http.client
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import fitz  # PyMuPDF
 import urllib.request
 import urllib.error
+import urllib.parse
+
+try:
+    # Optional native clean/chunk pass (ingest_fast.pyx), compiled on first
+    # import; needs Cython and a C compiler, otherwise the Python versions run.
+    import pyximport
+    pyximport.install(language_level=3)
+    import ingest_fast as _native
+except Exception:
+    _native = None
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -38,8 +62,16 @@ ENV_PATH     = BACKEND_DIR / ".env"
 CHUNK_TARGET_CHARS  = 2400   # ≈ 600 tokens
 CHUNK_OVERLAP_CHARS = 320    # ≈ 80 tokens
 MIN_CHUNK_CHARS     = 200
-EMBED_BATCH_SIZE    = 20     # chunks per OpenAI API call
+PAGE_MARGIN_FRAC    = 0.06   # top/bottom band treated as running header/footer
+EMBED_MAX_INPUTS    = 2048   # OpenAI per-request input limit
+EMBED_MAX_TOKENS    = 200_000  # 300k per-request cap; len//4 undercounts dense text
 EMBED_MODEL         = "text-embedding-3-small"
+OPENAI_API_BASE     = "https://api.openai.com/v1"
+BATCH_POLL_SECONDS  = 60     # --batch-api status polling interval
+EMBED_CONCURRENCY   = 8      # in-flight embedding requests across all sources
+EMBED_MAX_ATTEMPTS  = 6      # tries per request on 429/5xx/network errors
+EMBED_MAX_BACKOFF   = 60     # seconds, cap on exponential backoff
+RETRYABLE_STATUS    = (429, 500, 502, 503, 504)
 
 PDF_SOURCES = [
     {
@@ -75,32 +107,102 @@ def load_api_key() -> str:
     raise ValueError("OPENAI_API_KEY not found in .env")
 
 
+def page_body_text(page) -> str:
+    """Text of a page's body blocks, one paragraph per block.
+
+    Blocks starting in the top margin band or ending in the bottom one are
+    running headers/footers and page numbers, so they're dropped structurally
+    rather than pattern-matched out of the flattened text later.
+    """
+    height = page.rect.height
+    top = height * PAGE_MARGIN_FRAC
+    bottom = height * (1 - PAGE_MARGIN_FRAC)
+    blocks = []
+    # (x0, y0, x1, y1, text, block_no, block_type); block_type 1 is an image
+    for _x0, y0, _x1, y1, text, _no, block_type in page.get_text("blocks"):
+        if block_type != 0 or y0 < top or y1 > bottom:
+            continue
+        blocks.append(text.strip())
+    return "\n\n".join(b for b in blocks if b)
+
+
+def _extract_page(args: tuple[str, int]) -> tuple[int, str]:
+    """Worker: extract one page's text. Reopens the PDF because PyMuPDF
+    Document objects can't be shared across processes."""
+    path, i = args
+    doc = fitz.open(path)
+    try:
+        return i, page_body_text(doc[i])
+    finally:
+        doc.close()
+
+
+def iter_pages(pdf_path: Path) -> Iterator[str]:
+    """Yield each page's text in page order, extracted across a process pool."""
+    doc = fitz.open(str(pdf_path))
+    n = doc.page_count
+    doc.close()
+    jobs = [(str(pdf_path), i) for i in range(n)]
+    # spawn, not fork: this runs in a worker thread while embedding threads for
+    # other sources are live, and forking a multi-threaded process can deadlock
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=ctx) as ex:
+        # map() yields in submission order, so pages stream out as they're ready
+        for _, text in ex.map(_extract_page, jobs, chunksize=8):
+            yield text
+
+
+def _is_word_char(c: str) -> bool:
+    """Equivalent of regex \\w for a single character."""
+    return c.isalnum() or c == "_"
+
+
 def clean_text(raw: str) -> str:
-    """Clean extracted PDF text: remove artifacts, normalise whitespace."""
-    text = raw
-    # Normalise line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    # Remove form feeds
-    text = text.replace("\f", "\n\n")
-    # Fix hyphenated line-breaks: word-\ncontinued → wordcontinued
-    text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
-    # Remove lines that are just page numbers (1–4 digits alone on a line)
-    text = re.sub(r"^\s*\d{1,4}\s*$", "", text, flags=re.MULTILINE)
-    # Collapse 3+ blank lines to two
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    # Remove lines that are all-caps and very short (likely headers/footers)
-    lines = []
+    """Normalise whitespace and re-join hyphenated words in extracted text.
+
+    Headers, footers and page numbers are already gone (see page_body_text).
+    One pass over the lines does all the work: re-joining "word-" / "word"
+    line pairs, trimming and collapsing whitespace (str.split() is a C loop),
+    and keeping at most one blank line between paragraphs.
+    """
+    if _native is not None:
+        return _native.clean_text(raw)
+
+    # Normalise line endings; form feeds become paragraph breaks
+    text = raw.replace("\r\n", "\n").replace("\r", "\n").replace("\f", "\n\n")
+
+    out: list[str] = []
+    blank = True      # suppresses leading blanks and runs of 2+
+    carry = ""        # raw line ending in "word-", awaiting its continuation
+
+    def emit(line: str) -> None:
+        nonlocal blank
+        normalised = " ".join(line.split())
+        if normalised:
+            out.append(normalised)
+            blank = False
+        elif not blank:
+            out.append("")
+            blank = True
+
     for line in text.split("\n"):
-        stripped = line.strip()
-        if stripped and stripped.isupper() and len(stripped) < 60 and len(stripped.split()) <= 6:
+        if carry:
+            if line and _is_word_char(line[0]):
+                # Hyphenated line-break: word-\ncontinued → wordcontinued
+                line = carry[:-1] + line
+            else:
+                emit(carry)
+            carry = ""
+        if len(line) >= 2 and line[-1] == "-" and _is_word_char(line[-2]):
+            carry = line
             continue
-        lines.append(line)
-    text = "\n".join(lines)
-    # Collapse multiple spaces/tabs
-    text = re.sub(r"[ \t]{2,}", " ", text)
-    # Trim each line
-    text = "\n".join(l.strip() for l in text.split("\n"))
-    return text.strip()
+        emit(line)
+    if carry:
+        emit(carry)
+
+    if out and out[-1] == "":
+        out.pop()
+    return "\n".join(out)
 
 
 def extract_heading(text: str) -> Optional[str]:
@@ -114,90 +216,259 @@ def extract_heading(text: str) -> Optional[str]:
     return None
 
 
-def split_into_chunks(text: str) -> list[str]:
-    """Paragraph-aware chunking with overlap."""
-    paragraphs = re.split(r"\n\n+", text)
-    chunks: list[str] = []
-    current = ""
-    overlap = ""
+def iter_chunks(paragraphs: Iterable[str]) -> Iterator[str]:
+    """Paragraph-aware chunking with overlap, emitting chunks as they fill."""
+    if _native is not None:
+        return _native.iter_chunks(paragraphs, CHUNK_TARGET_CHARS, CHUNK_OVERLAP_CHARS, MIN_CHUNK_CHARS)
+    return _iter_chunks(paragraphs)
+
+
+def _iter_chunks(paragraphs: Iterable[str]) -> Iterator[str]:
+    # Buffer paragraphs and track the joined length rather than re-concatenating
+    # the growing chunk on every paragraph
+    current_parts: list[str] = []
+    current_len = 0
 
     for para in paragraphs:
         para = para.strip()
         if not para:
             continue
-        candidate = (current + "\n\n" + para).strip() if current else para
-        if len(candidate) > CHUNK_TARGET_CHARS and current:
-            chunks.append(current.strip())
+        new_len = current_len + 2 + len(para) if current_parts else len(para)
+        if new_len > CHUNK_TARGET_CHARS and current_parts:
+            chunk = "\n\n".join(current_parts)
+            if len(chunk) >= MIN_CHUNK_CHARS:
+                yield chunk
             # Build overlap from tail of current chunk
-            tail = current[-CHUNK_OVERLAP_CHARS:]
+            tail = chunk[-CHUNK_OVERLAP_CHARS:]
             idx = tail.find(" ")
-            overlap = tail[idx + 1:] if idx >= 0 else tail
-            current = (overlap + "\n\n" + para).strip()
+            overlap = (tail[idx + 1:] if idx >= 0 else tail).strip()
+            current_parts = [overlap, para] if overlap else [para]
+            current_len = len(overlap) + 2 + len(para) if overlap else len(para)
         else:
-            current = candidate
-
-    if current.strip() and len(current.strip()) >= MIN_CHUNK_CHARS:
-        chunks.append(current.strip())
+            current_parts.append(para)
+            current_len = new_len
 
-    return [c for c in chunks if len(c) >= MIN_CHUNK_CHARS]
+    if current_parts:
+        chunk = "\n\n".join(current_parts)
+        if len(chunk) >= MIN_CHUNK_CHARS:
+            yield chunk
 
 
 def estimate_tokens(text: str) -> int:
     return max(1, len(text) // 4)
 
 
-def embed_batch(texts: list[str], api_key: str) -> list[list[float]]:
-    """Call OpenAI embeddings endpoint, return list of float vectors."""
+def pack_batches(chunks: list[str]) -> list[list[str]]:
+    """Greedily fill embedding requests up to the input and token caps."""
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_tokens = 0
+    for chunk in chunks:
+        tokens = estimate_tokens(chunk)
+        if batch and (batch_tokens + tokens >= EMBED_MAX_TOKENS or len(batch) >= EMBED_MAX_INPUTS):
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(chunk)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class OpenAIAPIError(RuntimeError):
+    def __init__(self, status: int, body: str):
+        super().__init__(f"OpenAI API error {status}: {body}")
+        self.status = status
+
+
+# One keep-alive HTTPS connection per embedding worker thread, reused across
+# batches and sources so only the first request pays the TCP + TLS handshake.
+_HTTP = threading.local()
+
+
+def _post_json(path: str, payload: bytes, api_key: str) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """POST to the OpenAI API over this thread's persistent connection.
+
+    Returns (status, headers, body).
+    """
+    url = urllib.parse.urlsplit(OPENAI_API_BASE)
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
+
+    def send() -> tuple[int, http.client.HTTPMessage, bytes]:
+        if getattr(_HTTP, "conn", None) is None:
+            _HTTP.conn = http.client.HTTPSConnection(url.netloc, timeout=60)
+        try:
+            _HTTP.conn.request("POST", f"{url.path}{path}", body=payload, headers=headers)
+            resp = _HTTP.conn.getresponse()
+            return resp.status, resp.headers, resp.read()
+        except Exception:
+            # The connection's state is unknown; never reuse it
+            _HTTP.conn.close()
+            _HTTP.conn = None
+            raise
+
+    reused = getattr(_HTTP, "conn", None) is not None
+    try:
+        return send()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        # The server may have closed the idle keep-alive connection; resend
+        # once on a fresh one. Timeouts and everything else go to the caller's
+        # backed-off retry, since the request may already have been processed.
+        if not reused:
+            raise
+        return send()
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying: the API's Retry-After when it sends
+    one, otherwise exponential backoff with jitter."""
+    try:
+        return float(retry_after)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return min(EMBED_MAX_BACKOFF, 2 ** (attempt - 1)) + random.uniform(0, 1)
+
+
+def embed_batch(texts: list[str], api_key: str, source: str) -> list[list[float]]:
+    """Call OpenAI embeddings endpoint, return list of float vectors.
+
+    `source` only labels the retry log lines.
+    """
     payload = json.dumps({
         "model": EMBED_MODEL,
         "input": texts,
     }).encode("utf-8")
 
-    req = urllib.request.Request(
-        "https://api.openai.com/v1/embeddings",
-        data=payload,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"OpenAI API error {e.code}: {body}") from e
+    for attempt in range(1, EMBED_MAX_ATTEMPTS + 1):
+        retry_after = None
+        try:
+            status, headers, body = _post_json("/embeddings", payload, api_key)
+        except (http.client.HTTPException, OSError) as e:
+            if attempt == EMBED_MAX_ATTEMPTS:
+                raise
+            reason = f"{type(e).__name__}: {e}"
+        else:
+            if status == 200:
+                data = json.loads(body)
+                break
+            if status not in RETRYABLE_STATUS or attempt == EMBED_MAX_ATTEMPTS:
+                raise OpenAIAPIError(status, body.decode("utf-8", errors="replace"))
+            reason = f"HTTP {status}"
+            retry_after = headers.get("Retry-After")
+
+        delay = backoff_delay(attempt, retry_after)
+        print(f"  [{source}] ↻ {reason}, retrying in {delay:.1f}s (attempt {attempt}/{EMBED_MAX_ATTEMPTS})")
+        time.sleep(delay)
 
     # Sort by index to maintain order
     return [item["embedding"] for item in sorted(data["data"], key=lambda x: x["index"])]
 
 
+def embed_texts(texts: list[str], api_key: str, source: str) -> list[list[float]]:
+    """embed_batch, halving and retrying if the request is rejected as too large."""
+    try:
+        return embed_batch(texts, api_key, source)
+    except OpenAIAPIError as e:
+        # OpenAI reports going over the per-request token cap as a 400
+        # naming max_tokens_per_request rather than a 413
+        too_large = e.status == 413 or (e.status == 400 and "max_tokens_per_request" in str(e))
+        if not too_large or len(texts) == 1:
+            raise
+        mid = len(texts) // 2
+        return embed_texts(texts[:mid], api_key, source) + embed_texts(texts[mid:], api_key, source)
+
+
 # ── DB helpers ────────────────────────────────────────────────────────────────
 
 def db_connect() -> sqlite3.Connection:
-    return sqlite3.connect(str(DB_PATH))
+    # Autocommit mode (isolation_level=None): writers issue BEGIN IMMEDIATE /
+    # COMMIT themselves.
+    conn = sqlite3.connect(str(DB_PATH), isolation_level=None)
+    # Bulk-load pragmas. NORMAL is crash-safe under WAL; a lost tail is fine
+    # since re-running the ingest is idempotent.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-200000")      # ~200 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")     # 256 MB
+    return conn
+
+
+def db_now() -> str:
+    """Current UTC time in the same format as SQLite's datetime('now')."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
 def db_delete_source(conn: sqlite3.Connection, source: str) -> int:
     cur = conn.execute("DELETE FROM KnowledgeChunk WHERE source = ?", (source,))
-    conn.commit()
     return cur.rowcount
 
 
-def db_insert_chunk(
-    conn: sqlite3.Connection,
+# Time-ordered row ids: process start (ms) in the high bits, a counter in the
+# low 48. Fixed-width hex sorts like the integer, so bulk inserts append at the
+# right edge of the primary-key B-tree instead of landing on random pages (and
+# skip uuid4's os.urandom call per row).
+_ID_BASE = int(time.time() * 1000) << 48
+_ID_COUNTER = itertools.count()
+
+
+def pack_embedding(embedding: list[float]) -> bytes:
+    """Pack a vector as little-endian float32, the KnowledgeChunk.embedding format."""
+    return struct.pack(f"<{len(embedding)}f", *embedding)
+
+
+def content_hash(content: str) -> str:
+    """Reuse key for a chunk's embedding; includes EMBED_MODEL so switching
+    models re-embeds everything instead of mixing vector spaces."""
+    return hashlib.sha256(f"{EMBED_MODEL}\0{content}".encode("utf-8")).hexdigest()
+
+
+def db_load_embeddings(conn: sqlite3.Connection, source: str) -> dict[str, bytes]:
+    """Stored embeddings for a source keyed by content sha256."""
+    return dict(conn.execute(
+        "SELECT sha256, embedding FROM KnowledgeChunk WHERE source = ? AND sha256 IS NOT NULL",
+        (source,),
+    ).fetchall())
+
+
+def split_cached(chunks: list[str], cached: dict[str, bytes]) -> tuple[dict[int, bytes], dict[int, str]]:
+    """Partition chunks by index into (reusable packed embeddings, chunks to embed)."""
+    hits: dict[int, bytes] = {}
+    misses: dict[int, str] = {}
+    for i, chunk in enumerate(chunks):
+        blob = cached.get(content_hash(chunk))
+        if blob is not None:
+            hits[i] = blob
+        else:
+            misses[i] = chunk
+    return hits, misses
+
+
+def chunk_rows(
     source: str,
-    chapter: Optional[str],
-    content: str,
-    embedding: list[float],
-    token_count: int,
-) -> None:
-    import uuid
-    conn.execute(
-        "INSERT INTO KnowledgeChunk (id, source, chapter, content, embedding, tokenCount, createdAt) "
-        "VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
-        (str(uuid.uuid4()), source, chapter, content, json.dumps(embedding), token_count),
+    contents: list[str],
+    embeddings: list[bytes],
+    created_at: str,
+) -> list[tuple]:
+    """Build KnowledgeChunk rows (in column order) for db_insert_chunks from
+    contents and their packed embeddings."""
+    rows = []
+    for content, embedding in zip(contents, embeddings):
+        row_id = (_ID_BASE | next(_ID_COUNTER)).to_bytes(16, "big").hex()
+        rows.append((row_id, source, extract_heading(content), content,
+                     embedding, estimate_tokens(content), content_hash(content), created_at))
+    return rows
+
+
+def db_insert_chunks(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    """Insert rows from chunk_rows. Caller owns the transaction."""
+    conn.executemany(
+        "INSERT INTO KnowledgeChunk (id, source, chapter, content, embedding, tokenCount, sha256, createdAt) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
     )
 
 
@@ -207,9 +478,194 @@ def db_count(conn: sqlite3.Connection, source: Optional[str] = None) -> int:
     return conn.execute("SELECT COUNT(*) FROM KnowledgeChunk").fetchone()[0]
 
 
+# ── Concurrent embedding ──────────────────────────────────────────────────────
+
+async def embed_chunks(
+    source: str,
+    chunks: dict[int, str],
+    api_key: str,
+    sem: asyncio.Semaphore,
+) -> dict[int, bytes]:
+    """Embed {chunk_index: chunk}, returning packed embeddings by index.
+
+    Requests run in worker threads; `sem` is shared by every source so the
+    total in flight stays at EMBED_CONCURRENCY. A batch that still fails after
+    embed_batch's retries raises.
+    """
+    indices = list(chunks)
+    total = len(indices)
+    done = 0
+
+    async def run(batch_indices: list[int], batch: list[str]) -> list[tuple[int, bytes]]:
+        nonlocal done
+        async with sem:
+            embeddings = await asyncio.to_thread(embed_texts, batch, api_key, source)
+        done += len(batch)
+        print(f"  [{source}] ✓ {done}/{total} embedded")
+        return [(i, pack_embedding(e)) for i, e in zip(batch_indices, embeddings)]
+
+    tasks = []
+    offset = 0
+    for batch in pack_batches([chunks[i] for i in indices]):
+        tasks.append(asyncio.create_task(run(indices[offset: offset + len(batch)], batch)))
+        offset += len(batch)
+
+    try:
+        batch_results = await asyncio.gather(*tasks)
+    except BaseException:
+        # gather leaves the other batches running; cancel them so a failed
+        # source stops making paid calls. A request already in its worker
+        # thread still finishes, but nothing queued on `sem` starts.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    results: dict[int, bytes] = {}
+    for pairs in batch_results:
+        results.update(pairs)
+    return results
+
+
+# ── Batch API ─────────────────────────────────────────────────────────────────
+
+def openai_request(
+    api_key: str,
+    method: str,
+    path: str,
+    data: Optional[bytes] = None,
+    content_type: str = "application/json",
+) -> bytes:
+    """Issue a request against the OpenAI REST API and return the raw body.
+
+    GETs (batch polling, output download) retry transient failures with the
+    same backoff as embed_batch. POSTs don't: resending /batches after a
+    timeout could start, and bill, a second batch.
+    """
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if data is not None:
+        headers["Content-Type"] = content_type
+    attempts = EMBED_MAX_ATTEMPTS if method == "GET" else 1
+
+    for attempt in range(1, attempts + 1):
+        req = urllib.request.Request(f"{OPENAI_API_BASE}{path}", data=data, headers=headers, method=method)
+        retry_after = None
+        try:
+            with urllib.request.urlopen(req, timeout=300) as resp:
+                body = resp.read()
+            break
+        except urllib.error.HTTPError as e:
+            error = e.read().decode("utf-8", errors="replace")
+            if e.code not in RETRYABLE_STATUS or attempt == attempts:
+                raise OpenAIAPIError(e.code, error) from e
+            reason = f"HTTP {e.code}"
+            retry_after = e.headers.get("Retry-After")
+        except (http.client.HTTPException, OSError) as e:
+            if attempt == attempts:
+                raise
+            reason = f"{type(e).__name__}: {e}"
+
+        delay = backoff_delay(attempt, retry_after)
+        print(f"  ↻ {method} {path}: {reason}, retrying in {delay:.1f}s (attempt {attempt}/{attempts})")
+        time.sleep(delay)
+
+    return body
+
+
+def upload_batch_file(jsonl: bytes, api_key: str) -> str:
+    """Upload a JSONL request file with purpose=batch, return its file id."""
+    boundary = f"----liftoff{int(time.time() * 1000)}"
+    body = b"".join([
+        f"--{boundary}\r\n".encode(),
+        b'Content-Disposition: form-data; name="purpose"\r\n\r\nbatch\r\n',
+        f"--{boundary}\r\n".encode(),
+        b'Content-Disposition: form-data; name="file"; filename="embeddings.jsonl"\r\n',
+        b"Content-Type: application/jsonl\r\n\r\n",
+        jsonl,
+        f"\r\n--{boundary}--\r\n".encode(),
+    ])
+    resp = openai_request(api_key, "POST", "/files", body, f"multipart/form-data; boundary={boundary}")
+    return json.loads(resp)["id"]
+
+
+def submit_embedding_batch(chunks_by_source: dict[str, dict[int, str]], api_key: str) -> dict:
+    """Upload one embeddings request per chunk and start a Batch API job.
+    Returns the new batch object."""
+    lines = [
+        json.dumps({
+            "custom_id": f"{source}:{idx}",
+            "method": "POST",
+            "url": "/v1/embeddings",
+            "body": {"model": EMBED_MODEL, "input": chunk},
+        })
+        for source, chunks in chunks_by_source.items()
+        for idx, chunk in chunks.items()
+    ]
+    print(f"\n  Uploading batch file ({len(lines)} requests)...")
+    file_id = upload_batch_file(("\n".join(lines) + "\n").encode("utf-8"), api_key)
+
+    batch = json.loads(openai_request(api_key, "POST", "/batches", json.dumps({
+        "input_file_id": file_id,
+        "endpoint": "/v1/embeddings",
+        "completion_window": "24h",
+    }).encode("utf-8")))
+    print(f"  Batch {batch['id']} created (resume with --resume-batch {batch['id']})")
+    return batch
+
+
+def run_embedding_batch(
+    chunks_by_source: dict[str, dict[int, str]],
+    api_key: str,
+    resume_batch_id: Optional[str] = None,
+) -> dict[str, dict[int, list[float]]]:
+    """Embed chunks ({source: {chunk_index: chunk}}) through the Batch API
+    (half price, 24h window).
+
+    With `resume_batch_id`, waits on and collects an earlier run's batch
+    instead of submitting a new one; the sources and PDFs must be unchanged
+    since it was submitted so the chunk indices line up.
+
+    Returns {source: {chunk_index: embedding}}; chunks whose request failed are
+    simply absent from the result.
+    """
+    if resume_batch_id:
+        batch = json.loads(openai_request(api_key, "GET", f"/batches/{resume_batch_id}"))
+        print(f"\n  Resuming batch {batch['id']} ({batch['status']})")
+    else:
+        batch = submit_embedding_batch(chunks_by_source, api_key)
+
+    print(f"  Polling every {BATCH_POLL_SECONDS}s...")
+    while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = json.loads(openai_request(api_key, "GET", f"/batches/{batch['id']}"))
+        counts = batch.get("request_counts") or {}
+        print(f"  [{batch['status']}] {counts.get('completed', 0)}/{counts.get('total', 0)} done")
+
+    if batch["status"] != "completed":
+        raise RuntimeError(f"Batch {batch['id']} ended with status {batch['status']}")
+    if not batch.get("output_file_id"):
+        raise RuntimeError(f"Batch {batch['id']} produced no output (see error file {batch.get('error_file_id')})")
+
+    output = openai_request(api_key, "GET", f"/files/{batch['output_file_id']}/content")
+    results: dict[str, dict[int, list[float]]] = {source: {} for source in chunks_by_source}
+    for line in output.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        response = item.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        source, idx = item["custom_id"].rsplit(":", 1)
+        # A resumed batch may cover sources or chunks this run doesn't need
+        if int(idx) in chunks_by_source.get(source, {}):
+            results[source][int(idx)] = response["body"]["data"][0]["embedding"]
+    return results
+
+
 # ── Core ingestion ────────────────────────────────────────────────────────────
 
-def ingest_source(source_cfg: dict, api_key: str, dry_run: bool) -> None:
+def load_chunks(source_cfg: dict) -> Optional[list[str]]:
+    """Extract, clean and chunk one source's PDF. Returns None if it's missing."""
     source = source_cfg["source"]
     pdf_path = PDF_DIR / source_cfg["file"]
 
@@ -219,73 +675,159 @@ def ingest_source(source_cfg: dict, api_key: str, dry_run: bool) -> None:
     print(f"{'=' * 60}")
 
     if not pdf_path.exists():
-        print(f"  ✗ File not found: {pdf_path}")
-        return
+        print(f"  [{source}] ✗ File not found: {pdf_path}")
+        return None
+
+    # ── Extract → clean → chunk, streamed page by page ────────────────
+    # Pages are never concatenated: each is cleaned on arrival and its
+    # paragraphs fed straight to the chunker.
+    print(f"  [{source}] Extracting text with PyMuPDF...")
+    stats = {"pages": 0, "raw": 0, "cleaned": 0}
+
+    def paragraphs() -> Iterator[str]:
+        for page_text in iter_pages(pdf_path):
+            cleaned = clean_text(page_text)
+            stats["pages"] += 1
+            stats["raw"] += len(page_text)
+            stats["cleaned"] += len(cleaned)
+            # clean_text leaves exactly one blank line between paragraphs
+            yield from cleaned.split("\n\n")
+
+    chunks = list(iter_chunks(paragraphs()))
+    print(f"  [{source}] Pages: {stats['pages']}  Raw chars: {stats['raw']:,}  Cleaned chars: {stats['cleaned']:,}")
+    avg_len = sum(len(c) for c in chunks) // max(len(chunks), 1)
+    print(f"  [{source}] Chunks: {len(chunks)}  (avg {avg_len} chars / ~{avg_len // 4} tokens)")
+    return chunks
 
-    # ── Extract text with PyMuPDF ──────────────────────────────────────
-    print("  Extracting text with PyMuPDF...")
-    doc = fitz.open(str(pdf_path))
-    pages_text: list[str] = []
-    for page in doc:
-        pages_text.append(page.get_text("text"))  # type: ignore[attr-defined]
-    doc.close()
-    raw = "\n\n".join(pages_text)
-    print(f"  Pages: {len(pages_text)}  Raw chars: {len(raw):,}")
 
-    # ── Clean ─────────────────────────────────────────────────────────
-    cleaned = clean_text(raw)
-    print(f"  Cleaned chars: {len(cleaned):,}")
+def replace_source_chunks(
+    source: str,
+    chunks: list[str],
+    embeddings: dict[int, bytes],
+) -> None:
+    """Swap a source's stored chunks for the given packed embeddings (by chunk
+    index) in one short transaction."""
+    indices = sorted(embeddings)
+    rows = chunk_rows(source, [chunks[i] for i in indices], [embeddings[i] for i in indices], db_now())
 
-    # ── Chunk ─────────────────────────────────────────────────────────
-    chunks = split_into_chunks(cleaned)
-    avg_len = sum(len(c) for c in chunks) // max(len(chunks), 1)
-    print(f"  Chunks: {len(chunks)}  (avg {avg_len} chars / ~{avg_len // 4} tokens)")
-
-    if dry_run:
-        print("\n  [DRY RUN] First 3 chunks:\n")
-        for i, chunk in enumerate(chunks[:3]):
-            print(f"  --- Chunk {i + 1} ({len(chunk)} chars) ---")
-            preview = textwrap.indent(chunk[:400], "  ")
-            print(preview)
-            print()
+    conn = db_connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        deleted = db_delete_source(conn, source)
+        if deleted > 0:
+            print(f"  [{source}] Deleted {deleted} existing chunks")
+        db_insert_chunks(conn, rows)
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    print(f"  [{source}] ✅ complete: {len(indices)} stored, {len(chunks) - len(indices)} skipped")
+
+
+def preview_source(source_cfg: dict) -> None:
+    """--dry-run: chunk one source and print the first few chunks."""
+    chunks = load_chunks(source_cfg)
+    if chunks is None:
+        return
+    print("\n  [DRY RUN] First 3 chunks:\n")
+    for i, chunk in enumerate(chunks[:3]):
+        print(f"  --- Chunk {i + 1} ({len(chunk)} chars) ---")
+        preview = textwrap.indent(chunk[:400], "  ")
+        print(preview)
+        print()
+
+
+async def ingest_source(
+    source_cfg: dict,
+    api_key: str,
+    sem: asyncio.Semaphore,
+    extract_lock: asyncio.Lock,
+    write_lock: asyncio.Lock,
+) -> None:
+    """Chunk, embed and store one source; runs concurrently with the others.
+
+    Extraction is serialised (each run already uses every core) and so are DB
+    writes (SQLite allows one writer at a time, even in WAL mode). Embedding,
+    the slow part, overlaps freely across sources under the shared `sem`.
+    Existing rows stay untouched until the source's final write, so a failure
+    anywhere leaves them intact.
+    """
+    source = source_cfg["source"]
+    async with extract_lock:
+        chunks = await asyncio.to_thread(load_chunks, source_cfg)
+    if chunks is None:
         return
 
-    # ── Store ─────────────────────────────────────────────────────────
     conn = db_connect()
-    existing = db_count(conn, source)
-    if existing > 0:
-        deleted = db_delete_source(conn, source)
-        print(f"  Deleted {deleted} existing chunks for {source}")
+    embeddings, misses = split_cached(chunks, db_load_embeddings(conn, source))
+    conn.close()
+    print(f"  [{source}] Reusing {len(embeddings)} unchanged embeddings, embedding {len(misses)}")
 
-    stored = 0
-    skipped = 0
-    total = len(chunks)
-    total_batches = (total + EMBED_BATCH_SIZE - 1) // EMBED_BATCH_SIZE
+    embeddings.update(await embed_chunks(source, misses, api_key, sem))
+    async with write_lock:
+        await asyncio.to_thread(replace_source_chunks, source, chunks, embeddings)
 
-    for batch_idx in range(0, total, EMBED_BATCH_SIZE):
-        batch = chunks[batch_idx: batch_idx + EMBED_BATCH_SIZE]
-        batch_num = batch_idx // EMBED_BATCH_SIZE + 1
-        print(f"  Embedding batch {batch_num}/{total_batches}...", end="", flush=True)
 
-        try:
-            embeddings = embed_batch(batch, api_key)
-            for j, (content, embedding) in enumerate(zip(batch, embeddings)):
-                chapter = extract_heading(content)
-                token_count = estimate_tokens(content)
-                db_insert_chunk(conn, source, chapter, content, embedding, token_count)
-                stored += 1
-            conn.commit()
-            print(f" ✓ ({stored}/{total})")
-        except Exception as e:
-            print(f" ✗ ERROR: {e}")
-            skipped += len(batch)
-
-        # Brief pause between batches
-        if batch_idx + EMBED_BATCH_SIZE < total:
-            time.sleep(0.15)
+async def ingest_sources(sources: list[dict], api_key: str) -> list[str]:
+    """Ingest all sources concurrently. Returns the sources that failed."""
+    sem = asyncio.Semaphore(EMBED_CONCURRENCY)
+    extract_lock = asyncio.Lock()
+    write_lock = asyncio.Lock()
+    results = await asyncio.gather(
+        *[ingest_source(cfg, api_key, sem, extract_lock, write_lock) for cfg in sources],
+        return_exceptions=True,
+    )
+    failed = []
+    for cfg, result in zip(sources, results):
+        if isinstance(result, BaseException):
+            print(f"  [{cfg['source']}] ✗ ERROR: {result}")
+            failed.append(cfg["source"])
+    return failed
+
+
+def ingest_batch_api(
+    sources: list[dict],
+    api_key: str,
+    resume_batch_id: Optional[str] = None,
+) -> list[str]:
+    """Chunk every source up front, embed them all in one Batch API job (or
+    collect `resume_batch_id`), then replace each source's rows. Existing rows
+    are untouched until the batch has completed, and a source with any failed
+    request keeps them. Returns the sources that failed."""
+    chunks_by_source: dict[str, list[str]] = {}
+    for source_cfg in sources:
+        chunks = load_chunks(source_cfg)
+        if chunks:
+            chunks_by_source[source_cfg["source"]] = chunks
+    if not chunks_by_source:
+        return []
 
+    conn = db_connect()
+    embeddings: dict[str, dict[int, bytes]] = {}
+    to_embed: dict[str, dict[int, str]] = {}
+    for source, chunks in chunks_by_source.items():
+        embeddings[source], misses = split_cached(chunks, db_load_embeddings(conn, source))
+        print(f"  [{source}] Reusing {len(embeddings[source])} unchanged embeddings, {len(misses)} to embed")
+        if misses:
+            to_embed[source] = misses
     conn.close()
-    print(f"  ✅ {source} complete: {stored} stored, {skipped} skipped")
+
+    failed: list[str] = []
+    if to_embed:
+        for source, results in run_embedding_batch(to_embed, api_key, resume_batch_id).items():
+            missing = len(to_embed[source]) - len(results)
+            if missing:
+                print(f"  [{source}] ✗ ERROR: {missing} batch requests failed")
+                failed.append(source)
+                continue
+            embeddings[source].update((i, pack_embedding(e)) for i, e in results.items())
+    for source, chunks in chunks_by_source.items():
+        if source not in failed:
+            replace_source_chunks(source, chunks, embeddings[source])
+    return failed
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -294,6 +836,10 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="LiftOff RAG ingestion")
     parser.add_argument("--source", help="Ingest only this source (NASM|ACE|NCSF|NFPT)")
     parser.add_argument("--dry-run", action="store_true", help="Preview chunks, no DB writes")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="Embed via the OpenAI Batch API (half price, may take hours)")
+    parser.add_argument("--resume-batch", metavar="BATCH_ID",
+                        help="Collect an earlier --batch-api run's batch instead of submitting a new one")
     args = parser.parse_args()
 
     print("\n🔬 LiftOff RAG Ingestion")
@@ -310,8 +856,14 @@ def main() -> None:
     api_key = "" if args.dry_run else load_api_key()
 
     start = time.time()
-    for source_cfg in sources:
-        ingest_source(source_cfg, api_key, args.dry_run)
+    failed: list[str] = []
+    if args.dry_run:
+        for source_cfg in sources:
+            preview_source(source_cfg)
+    elif args.batch_api or args.resume_batch:
+        failed = ingest_batch_api(sources, api_key, args.resume_batch)
+    else:
+        failed = asyncio.run(ingest_sources(sources, api_key))
 
     elapsed = time.time() - start
 
@@ -328,6 +880,9 @@ def main() -> None:
         print(f"   Total: {total} chunks")
 
     print(f"\n⏱  Done in {elapsed:.1f}s")
+    if failed:
+        print(f"✗ Failed (previous chunks kept): {', '.join(failed)}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
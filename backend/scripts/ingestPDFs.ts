@@ -202,7 +202,8 @@ async function ingestSource(
             source,
             chapter,
             content,
-            embedding: JSON.stringify(embedding),
+            // Packed float32 BLOB — see KnowledgeChunk in schema.prisma
+            embedding: Buffer.from(new Float32Array(embedding).buffer),
             tokenCount,
           },
         });
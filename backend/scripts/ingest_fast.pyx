@@ -0,0 +1,130 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native text pass for ingestPDFs.py.
+
+Compiled on first import via pyximport (needs Cython and a C compiler);
+ingestPDFs.py falls back to its pure-Python clean_text / iter_chunks
+when this module can't be built. Output is identical to the Python versions.
+
+Works on str with typed Py_UCS4 reads rather than UTF-8 bytes so whitespace
+and word-character tests keep Python's Unicode semantics (PDF text is full
+of non-breaking spaces and accented words).
+"""
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+
+cdef extern from "Python.h":
+    bint Py_UNICODE_ISSPACE(Py_UCS4 ch)
+    bint Py_UNICODE_ISALNUM(Py_UCS4 ch)
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+    int PyUnicode_4BYTE_KIND
+
+
+cdef inline bint _is_word_char(Py_UCS4 c):
+    return Py_UNICODE_ISALNUM(c) or c == u"_"
+
+
+def clean_text(str raw):
+    """Single character-level pass equivalent to ingestPDFs.clean_text."""
+    cdef str text = raw.replace("\r\n", "\n").replace("\r", "\n").replace("\f", "\n\n")
+    cdef Py_ssize_t n = len(text)
+    # Output never outgrows the input: every emitted space or newline stands
+    # in for at least one input whitespace character
+    cdef Py_UCS4 *buf = <Py_UCS4 *>PyMem_Malloc((n + 1) * sizeof(Py_UCS4))
+    if buf == NULL:
+        raise MemoryError()
+
+    cdef Py_ssize_t i = 0, seg_start, j, end, out_len = 0
+    cdef Py_UCS4 c
+    cdef bint joined
+    cdef bint has_content = False    # current logical line emitted a char
+    cdef bint pending_space = False  # whitespace seen since the last char
+    cdef bint saw_blank = False      # blank line since the last content line
+
+    try:
+        while i <= n:
+            # Raw line segment [seg_start, j)
+            seg_start = i
+            j = i
+            while j < n and text[j] != u"\n":
+                j += 1
+
+            # Hyphenated line-break: word-\ncontinued → wordcontinued; the
+            # logical line carries on into the next segment
+            if (j < n and j - seg_start >= 2 and text[j - 1] == u"-"
+                    and _is_word_char(text[j - 2])
+                    and j + 1 < n and _is_word_char(text[j + 1])):
+                end = j - 1
+                joined = True
+            else:
+                end = j
+                joined = False
+
+            while i < end:
+                c = text[i]
+                i += 1
+                if Py_UNICODE_ISSPACE(c):
+                    if has_content:
+                        pending_space = True
+                    continue
+                if not has_content:
+                    if out_len > 0:
+                        buf[out_len] = u"\n"
+                        out_len += 1
+                        if saw_blank:
+                            buf[out_len] = u"\n"
+                            out_len += 1
+                    saw_blank = False
+                    has_content = True
+                elif pending_space:
+                    buf[out_len] = u" "
+                    out_len += 1
+                pending_space = False
+                buf[out_len] = c
+                out_len += 1
+
+            i = j + 1
+            if joined:
+                continue
+            if not has_content:
+                saw_blank = True
+            has_content = False
+            pending_space = False
+
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buf, out_len)
+    finally:
+        PyMem_Free(buf)
+
+
+def iter_chunks(paragraphs, Py_ssize_t target_chars, Py_ssize_t overlap_chars, Py_ssize_t min_chars):
+    """Typed port of ingestPDFs.iter_chunks."""
+    cdef Py_ssize_t current_len = 0, new_len, idx
+    cdef list current_parts = []
+    cdef str para, chunk, tail, overlap
+
+    for para in paragraphs:
+        para = para.strip()
+        if not para:
+            continue
+        new_len = current_len + 2 + len(para) if current_parts else len(para)
+        if new_len > target_chars and current_parts:
+            chunk = "\n\n".join(current_parts)
+            if len(chunk) >= min_chars:
+                yield chunk
+            tail = chunk[-overlap_chars:]
+            idx = tail.find(" ")
+            overlap = (tail[idx + 1:] if idx >= 0 else tail).strip()
+            if overlap:
+                current_parts = [overlap, para]
+                current_len = len(overlap) + 2 + len(para)
+            else:
+                current_parts = [para]
+                current_len = len(para)
+        else:
+            current_parts.append(para)
+            current_len = new_len
+
+    if current_parts:
+        chunk = "\n\n".join(current_parts)
+        if len(chunk) >= min_chars:
+            yield chunk
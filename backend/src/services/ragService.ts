@@ -22,7 +22,7 @@ interface StoredChunk {
   source: string;
   chapter: string | null;
   content: string;
-  embedding: number[];
+  embedding: Float32Array;
 }
 
 interface RetrievedChunk {
@@ -52,6 +52,14 @@ export type ProgramSourceSection =
   | 'volume'
   | 'nutrition';
 
+// ── Embedding encoding ─────────────────────────────────────────────────────────
+
+/** Decode a KnowledgeChunk.embedding BLOB (packed little-endian float32). */
+function decodeEmbedding(bytes: Uint8Array): Float32Array {
+  // Copy out of the row buffer — its byteOffset isn't guaranteed 4-byte aligned
+  return new Float32Array(bytes.buffer.slice(bytes.byteOffset, bytes.byteOffset + bytes.byteLength));
+}
+
 // ── In-memory cache ────────────────────────────────────────────────────────────
 
 let cachedChunks: StoredChunk[] | null = null;
@@ -73,7 +81,7 @@ async function loadChunks(): Promise<StoredChunk[]> {
     source: row.source,
     chapter: row.chapter,
     content: row.content,
-    embedding: JSON.parse(row.embedding) as number[],
+    embedding: decodeEmbedding(row.embedding),
   }));
   cacheLoadedAt = now;
 
@@ -82,7 +90,7 @@ async function loadChunks(): Promise<StoredChunk[]> {
 
 // ── Math ───────────────────────────────────────────────────────────────────────
 
-function cosineSimilarity(a: number[], b: number[]): number {
+function cosineSimilarity(a: ArrayLike<number>, b: ArrayLike<number>): number {
   let dot = 0;
   let normA = 0;
   let normB = 0;